@@ -14,16 +14,19 @@ def summarize_runs(root: Path) -> dict[str, float]:
         with csv_file.open("r", encoding="utf-8") as fp:
             reader = csv.DictReader(fp)
             for row in reader:
-                rows.append({k: float(v) for k, v in row.items() if k not in {"paper_id", "notes"}})
+                rows.append(
+                    {k: float(v) for k, v in row.items() if k not in {"paper_id", "notes"} and v}
+                )
         if not rows:
             continue
-        per_run.append({metric: mean(r[metric] for r in rows) for metric in rows[0].keys()})
+        metrics = [m for m in rows[0] if all(m in r for r in rows)]
+        per_run.append({metric: mean(r[metric] for r in rows) for metric in metrics})
 
     if not per_run:
         return {}
 
     summary: dict[str, float] = {}
-    metrics = per_run[0].keys()
+    metrics = [m for m in per_run[0] if all(m in run for run in per_run)]
     for metric in metrics:
         values = [run[metric] for run in per_run]
         summary[f"{metric}_mean"] = round(mean(values), 4)
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import argparse
 import json
+import sys
 
-from .llm import OllamaBackend, TransformersBackend
+from .evaluation import EMBEDDING_THRESHOLD
+from .llm import AdaptiveConcurrencyBackend, LLMBackend, OllamaBackend, TransformersBackend
 from .pipeline import Text2ODPPipeline
 
 
@@ -14,17 +16,82 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--backend", choices=["ollama", "transformers"], default="ollama")
     parser.add_argument("--model", type=str, default="llama3.1:8b")
     parser.add_argument("--output-dir", type=str, default="outputs")
+    parser.add_argument("--timeout", type=float, default=180.0, help="Per-request Ollama timeout (s)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Papers processed concurrently (default: 1, or --max-concurrency with --adaptive)",
+    )
+    parser.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="Adapt in-flight LLM requests to observed latency and errors",
+    )
+    parser.add_argument("--max-concurrency", type=int, default=8)
+    parser.add_argument("--target-latency", type=float, default=30.0)
+    parser.add_argument(
+        "--embedding-metrics",
+        action="store_true",
+        help="Add embedding-based coverage and CQ answerability (requires the 'embed' extra)",
+    )
+    parser.add_argument("--embedding-model", type=str, default=None)
+    parser.add_argument(
+        "--embedding-threshold",
+        type=float,
+        default=EMBEDDING_THRESHOLD,
+        help="Cosine similarity counted as a match; tune it per embedding model",
+    )
+    parser.add_argument("--embedding-cache", type=str, default=".embedding_cache")
     return parser
 
 
 def main() -> None:
-    args = build_parser().parse_args()
+    parser = build_parser()
+    args = parser.parse_args()
+    workers_given = args.workers is not None
+    if args.backend == "transformers":
+        # A single in-process HF pipeline is not thread-safe and gains nothing from threads.
+        if workers_given and args.workers > 1:
+            parser.error("--workers > 1 is not supported with --backend transformers")
+        args.workers = 1
+    elif not workers_given:
+        args.workers = args.max_concurrency if args.adaptive else 1
+
+    llm: LLMBackend
     if args.backend == "ollama":
-        llm = OllamaBackend(model=args.model)
+        llm = OllamaBackend(model=args.model, timeout=args.timeout)
     else:
         llm = TransformersBackend(model=args.model)
+    if args.adaptive:
+        if workers_given and args.workers < args.max_concurrency:
+            print(
+                f"warning: --adaptive with --workers {args.workers} below --max-concurrency "
+                f"{args.max_concurrency}; at most {args.workers} requests can be in flight.",
+                file=sys.stderr,
+            )
+        llm = AdaptiveConcurrencyBackend(
+            llm,
+            max_limit=args.max_concurrency,
+            target_latency=args.target_latency,
+        )
+
+    embedding_index = None
+    if args.embedding_metrics:
+        from .embeddings import DEFAULT_EMBEDDING_MODEL, EmbeddingIndex
+
+        embedding_index = EmbeddingIndex(
+            cache_dir=args.embedding_cache,
+            model=args.embedding_model or DEFAULT_EMBEDDING_MODEL,
+        )
 
-    pipeline = Text2ODPPipeline(llm=llm, output_dir=args.output_dir)
+    pipeline = Text2ODPPipeline(
+        llm=llm,
+        output_dir=args.output_dir,
+        workers=args.workers,
+        embedding_index=embedding_index,
+        embedding_threshold=args.embedding_threshold,
+    )
     summary = pipeline.run(query=args.query, limit=args.limit)
     print(json.dumps(summary, indent=2))
 
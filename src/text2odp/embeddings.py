@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - no advisory locks on Windows
+    fcntl = None  # type: ignore[assignment]
+
+DEFAULT_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+def text_key(text: str) -> str:
+    return hashlib.sha1(text.strip().encode("utf-8")).hexdigest()
+
+
+class EmbeddingIndex:
+    """Persistent embedding cache keyed by text hash.
+
+    Vectors are L2-normalised float32 rows appended to ``vectors.f32`` and read back
+    through a memory map; ``keys.txt`` holds one hash per row. Each model gets its own
+    subdirectory, so labels and CQs shared across papers and runs are embedded once.
+    Appends hold an exclusive lock on ``cache.lock`` so concurrent runs can share a
+    cache. ``encoder`` is any object with a sentence-transformers style ``encode``;
+    when omitted, ``model`` is loaded on the first cache miss.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path = ".embedding_cache",
+        model: str = DEFAULT_EMBEDDING_MODEL,
+        batch_size: int = 64,
+        device: str = "cpu",
+        encoder=None,
+    ) -> None:
+        self.model_name = model
+        self.batch_size = batch_size
+        self.device = device
+        self.cache_dir = Path(cache_dir) / re.sub(r"[^A-Za-z0-9_.-]+", "__", model)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._vectors_path = self.cache_dir / "vectors.f32"
+        self._keys_path = self.cache_dir / "keys.txt"
+        self._meta_path = self.cache_dir / "meta.json"
+        self._lock_path = self.cache_dir / "cache.lock"
+        self._model = encoder
+        self._dim: int | None = None
+        self._rows: dict[str, int] = {}
+        self._matrix: np.ndarray | None = None
+
+        with self._locked():
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, text: str) -> bool:
+        return text_key(text) in self._rows
+
+    @contextmanager
+    def _locked(self):
+        with self._lock_path.open("a") as fp:
+            if fcntl is not None:
+                fcntl.flock(fp, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(fp, fcntl.LOCK_UN)
+
+    def _load(self) -> None:
+        """Read the on-disk state, repairing any interrupted append. Requires the lock."""
+        if self._meta_path.exists():
+            meta = json.loads(self._meta_path.read_text(encoding="utf-8"))
+            if meta["model"] != self.model_name:
+                raise ValueError(
+                    f"Embedding cache {self.cache_dir} belongs to model {meta['model']!r}, "
+                    f"not {self.model_name!r}"
+                )
+            self._dim = meta["dim"]
+
+        raw = self._keys_path.read_text(encoding="utf-8") if self._keys_path.exists() else ""
+        keys = raw.splitlines()
+        if raw and not raw.endswith("\n"):
+            keys = keys[:-1]  # torn final line
+        size = self._vectors_path.stat().st_size if self._vectors_path.exists() else 0
+        row_bytes = 4 * self._dim if self._dim else 0
+        if row_bytes:
+            keys = keys[: size // row_bytes]
+        else:
+            keys = []
+
+        # Vectors are written before keys, so a crash leaves orphaned or partial rows
+        # after the last key; cut them off so new rows line up with their keys again.
+        if size != len(keys) * row_bytes:
+            with self._vectors_path.open("r+b") as fp:
+                fp.truncate(len(keys) * row_bytes)
+        if raw != "".join(f"{key}\n" for key in keys):
+            self._keys_path.write_text("".join(f"{key}\n" for key in keys), encoding="utf-8")
+
+        self._rows = {key: row for row, key in enumerate(keys)}
+        self._remap()
+
+    def _load_model(self):
+        if self._model is None:
+            from sentence_transformers import SentenceTransformer
+
+            self._model = SentenceTransformer(self.model_name, device=self.device)
+        return self._model
+
+    def _remap(self) -> None:
+        if self._dim and self._rows:
+            self._matrix = np.memmap(
+                self._vectors_path, dtype=np.float32, mode="r", shape=(len(self._rows), self._dim)
+            )
+        else:
+            self._matrix = None
+
+    def _append(self, keys: list[str], vectors: np.ndarray) -> None:
+        with self._locked():
+            # Another run may have appended since we last looked.
+            self._load()
+            fresh = [i for i, key in enumerate(keys) if key not in self._rows]
+            if not fresh:
+                return
+            if self._dim is None:
+                self._dim = int(vectors.shape[1])
+                tmp = self._meta_path.with_suffix(".tmp")
+                tmp.write_text(
+                    json.dumps({"model": self.model_name, "dim": self._dim}), encoding="utf-8"
+                )
+                os.replace(tmp, self._meta_path)
+            elif vectors.shape[1] != self._dim:
+                raise ValueError(
+                    f"Encoder returned {vectors.shape[1]}-dim vectors but the cache for "
+                    f"{self.model_name!r} stores {self._dim}-dim vectors"
+                )
+            with self._vectors_path.open("ab") as fp:
+                fp.write(np.ascontiguousarray(vectors[fresh], dtype=np.float32).tobytes())
+                fp.flush()
+                os.fsync(fp.fileno())
+            with self._keys_path.open("a", encoding="utf-8") as fp:
+                fp.write("".join(f"{keys[i]}\n" for i in fresh))
+            for i in fresh:
+                self._rows[keys[i]] = len(self._rows)
+            self._remap()
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        """Return one normalised row per text, encoding only texts missing from the cache."""
+        keys = [text_key(t) for t in texts]
+        missing: dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in self._rows and key not in missing:
+                missing[key] = text.strip()
+
+        if missing:
+            vectors = self._load_model().encode(
+                list(missing.values()),
+                batch_size=self.batch_size,
+                normalize_embeddings=True,
+                convert_to_numpy=True,
+                show_progress_bar=False,
+            )
+            self._append(list(missing.keys()), np.asarray(vectors, dtype=np.float32))
+
+        if not keys:
+            return np.zeros((0, self._dim or 0), dtype=np.float32)
+        assert self._matrix is not None
+        return np.asarray(self._matrix[[self._rows[k] for k in keys]])
+
+
+def max_similarity(queries: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+    """Best cosine similarity of each query row against all candidate rows."""
+    if len(queries) == 0:
+        return np.zeros(0, dtype=np.float32)
+    if len(candidates) == 0:
+        return np.zeros(len(queries), dtype=np.float32)
+    return (queries @ candidates.T).max(axis=1)
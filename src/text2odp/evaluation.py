@@ -3,10 +3,17 @@ from __future__ import annotations
 from collections import Counter
 import math
 import re
+from typing import TYPE_CHECKING
 
 from .schemas import ConceptRelationGraph, EvaluationResult, ODPArtifact, PaperRecord, ScenarioAndCQs
 
+if TYPE_CHECKING:
+    from .embeddings import EmbeddingIndex
+
 TOKEN_RE = re.compile(r"[A-Za-z][A-Za-z\-]+")
+SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+CAMEL_RE = re.compile(r"(?<=[a-z0-9])(?=[A-Z])|[_\-]+")
+EMBEDDING_THRESHOLD = 0.4
 
 
 def _tokenize(text: str) -> list[str]:
@@ -53,21 +60,101 @@ def self_consistency(odp: ODPArtifact, graph: ConceptRelationGraph) -> float:
     return overlap / len(class_set)
 
 
+def _sentences(text: str) -> list[str]:
+    return [s for s in (p.strip() for p in SENTENCE_RE.split(text)) if s]
+
+
+def _label(name: str) -> str:
+    return CAMEL_RE.sub(" ", name).strip()
+
+
+def embedding_scores(
+    items: list[tuple[PaperRecord, ScenarioAndCQs, ConceptRelationGraph]],
+    index: EmbeddingIndex,
+    threshold: float = EMBEDDING_THRESHOLD,
+) -> list[tuple[float, float]]:
+    """Embedding coverage and CQ answerability for many papers at once.
+
+    Every distinct text across ``items`` is embedded in one batched call, so cached
+    labels and CQs cost nothing. Returns ``(coverage, answerability)`` per item: the
+    share of concepts matching some abstract sentence and the share of CQs matching
+    some concept or relation, both at cosine similarity >= ``threshold``.
+    """
+    from .embeddings import max_similarity
+
+    texts: dict[str, int] = {}
+    per_item = []
+    for paper, scenario, graph in items:
+        sentences = _sentences(paper.abstract)
+        concepts = [_label(c) for c in graph.concepts]
+        vocab = concepts + [_label(r) for r in graph.relations]
+        cqs = scenario.competency_questions
+        for text in (*sentences, *vocab, *cqs):
+            texts.setdefault(text, len(texts))
+        per_item.append((sentences, concepts, vocab, cqs))
+
+    vectors = index.embed(list(texts))
+
+    def rows(group: list[str]):
+        return vectors[[texts[t] for t in group]]
+
+    out = []
+    for sentences, concepts, vocab, cqs in per_item:
+        coverage = 0.0
+        if concepts:
+            coverage = float((max_similarity(rows(concepts), rows(sentences)) >= threshold).mean())
+        answerability = 0.0
+        if cqs:
+            answerability = float((max_similarity(rows(cqs), rows(vocab)) >= threshold).mean())
+        out.append((coverage, answerability))
+    return out
+
+
+def embedding_coverage(
+    abstract: str, concepts: list[str], index: EmbeddingIndex, threshold: float = EMBEDDING_THRESHOLD
+) -> float:
+    paper = PaperRecord(paper_id="", title="", abstract=abstract)
+    graph = ConceptRelationGraph(concepts=concepts)
+    return embedding_scores([(paper, ScenarioAndCQs(scenario=""), graph)], index, threshold)[0][0]
+
+
+def embedding_cq_answerability(
+    cqs: list[str],
+    concepts: list[str],
+    relations: list[str],
+    index: EmbeddingIndex,
+    threshold: float = EMBEDDING_THRESHOLD,
+) -> float:
+    paper = PaperRecord(paper_id="", title="", abstract="")
+    scenario = ScenarioAndCQs(scenario="", competency_questions=cqs)
+    graph = ConceptRelationGraph(concepts=concepts, relations=relations)
+    return embedding_scores([(paper, scenario, graph)], index, threshold)[0][1]
+
+
 def evaluate(
     paper: PaperRecord,
     scenario: ScenarioAndCQs,
     graph: ConceptRelationGraph,
     odp: ODPArtifact,
+    embedding: tuple[float, float] | None = None,
 ) -> EvaluationResult:
     lc = lexical_coverage(paper.abstract, graph.concepts)
     gd = graph_density(graph)
     aq = cq_answerability_proxy(scenario.competency_questions, graph.concepts, graph.relations)
     sc = self_consistency(odp, graph)
 
-    notes = (
-        "Scores in [0,1]. High lexical coverage can be misleading for paraphrases; "
-        "consider adding embedding-based metrics for publication-level evaluation."
-    )
+    if embedding is None:
+        notes = (
+            "Scores in [0,1]. High lexical coverage can be misleading for paraphrases; "
+            "consider adding embedding-based metrics for publication-level evaluation."
+        )
+        ec = eq = None
+    else:
+        notes = (
+            "Scores in [0,1]. Embedding metrics depend on the embedding model and "
+            "similarity threshold; compare runs only when both match."
+        )
+        ec, eq = (round(v, 4) for v in embedding)
     return EvaluationResult(
         paper_id=paper.paper_id,
         lexical_coverage=round(lc, 4),
@@ -75,6 +162,8 @@ def evaluate(
         cq_answerability_proxy=round(aq, 4),
         self_consistency=round(sc, 4),
         notes=notes,
+        embedding_coverage=ec,
+        embedding_cq_answerability=eq,
     )
 
 
@@ -82,6 +171,9 @@ def aggregate(results: list[EvaluationResult]) -> dict[str, float]:
     if not results:
         return {}
     keys = ["lexical_coverage", "graph_density", "cq_answerability_proxy", "self_consistency"]
+    for key in ["embedding_coverage", "embedding_cq_answerability"]:
+        if all(getattr(r, key) is not None for r in results):
+            keys.append(key)
     out: dict[str, float] = {}
     for key in keys:
         mean = sum(getattr(r, key) for r in results) / len(results)
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import json
 import os
+import threading
+import time
 from abc import ABC, abstractmethod
 
 import requests
@@ -14,9 +16,15 @@ class LLMBackend(ABC):
 
 
 class OllamaBackend(LLMBackend):
-    def __init__(self, model: str = "llama3.1:8b", endpoint: str | None = None) -> None:
+    def __init__(
+        self,
+        model: str = "llama3.1:8b",
+        endpoint: str | None = None,
+        timeout: float = 180.0,
+    ) -> None:
         self.model = model
         self.endpoint = endpoint or os.getenv("OLLAMA_ENDPOINT", "http://localhost:11434")
+        self.timeout = timeout
 
     def generate(self, prompt: str, temperature: float = 0.2, max_tokens: int = 1024) -> str:
         payload = {
@@ -27,7 +35,7 @@ class OllamaBackend(LLMBackend):
         }
         import requests
 
-        response = requests.post(f"{self.endpoint}/api/generate", json=payload, timeout=180)
+        response = requests.post(f"{self.endpoint}/api/generate", json=payload, timeout=self.timeout)
         response.raise_for_status()
         return response.json().get("response", "")
 
@@ -51,6 +59,104 @@ class TransformersBackend(LLMBackend):
         return result[0]["generated_text"]
 
 
+class AdaptiveConcurrencyBackend(LLMBackend):
+    """Bound in-flight requests to ``backend`` with an AIMD limit driven by latency.
+
+    Each success under ``target_latency`` that was issued with the limit fully used
+    grows the limit by about ``increase`` per window of completed calls; a slow call
+    or an error multiplies it by ``decrease``.
+    Wrap each backend separately so that every server gets its own limit.
+    """
+
+    def __init__(
+        self,
+        backend: LLMBackend,
+        initial_limit: float = 2.0,
+        min_limit: float = 1.0,
+        max_limit: float = 16.0,
+        target_latency: float = 30.0,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+    ) -> None:
+        if not 1.0 <= min_limit <= max_limit:
+            raise ValueError("Expected 1 <= min_limit <= max_limit")
+        if not 0.0 < decrease < 1.0:
+            raise ValueError("decrease must be in (0, 1)")
+        self.backend = backend
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.target_latency = target_latency
+        self.increase = increase
+        self.decrease = decrease
+        self._limit = min(max(initial_limit, min_limit), max_limit)
+        self._in_flight = 0
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+        self._stats = {
+            "requests": 0,
+            "errors": 0,
+            "slow": 0,
+            "total_latency": 0.0,
+            "max_in_flight": 0,
+        }
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def generate(self, prompt: str, temperature: float = 0.2, max_tokens: int = 1024) -> str:
+        with self._cond:
+            while self._in_flight >= int(self._limit):
+                self._cond.wait()
+            self._in_flight += 1
+            self._stats["max_in_flight"] = max(self._stats["max_in_flight"], self._in_flight)
+            saturated = self._in_flight >= int(self._limit)
+
+        start = time.monotonic()
+        failed = True
+        try:
+            text = self.backend.generate(prompt, temperature=temperature, max_tokens=max_tokens)
+            failed = False
+        finally:
+            self._release(start, time.monotonic() - start, failed, saturated)
+        return text
+
+    def _release(self, start: float, latency: float, failed: bool, saturated: bool) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            self._stats["requests"] += 1
+            self._stats["total_latency"] += latency
+            if failed:
+                self._stats["errors"] += 1
+            elif latency > self.target_latency:
+                self._stats["slow"] += 1
+
+            if failed or latency > self.target_latency:
+                # Only back off once per congestion event: calls that were already in
+                # flight when the limit last dropped do not shrink it again.
+                if start >= self._last_decrease:
+                    self._limit = max(self.min_limit, self._limit * self.decrease)
+                    self._last_decrease = time.monotonic()
+            elif saturated:
+                # Grow only when the limit was actually reached; otherwise the fast
+                # response says nothing about how the server copes with more load.
+                self._limit = min(self.max_limit, self._limit + self.increase / self._limit)
+            self._cond.notify_all()
+
+    def stats(self) -> dict[str, float]:
+        with self._cond:
+            requests = self._stats["requests"]
+            return {
+                "limit": round(self._limit, 4),
+                "in_flight": self._in_flight,
+                "max_in_flight": self._stats["max_in_flight"],
+                "requests": requests,
+                "errors": self._stats["errors"],
+                "slow": self._stats["slow"],
+                "mean_latency": round(self._stats["total_latency"] / requests, 4) if requests else 0.0,
+            }
+
+
 class JSONConstrainedMixin:
     @staticmethod
     def parse_json_or_raise(text: str) -> dict:
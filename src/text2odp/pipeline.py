@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import csv
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING, Sequence
 
 try:
     from tenacity import retry, stop_after_attempt, wait_exponential
@@ -22,11 +24,14 @@ except ImportError:  # pragma: no cover - fallback for minimal environments
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from .data import SemanticScholarCollector
-from .evaluation import aggregate, evaluate
+from .evaluation import EMBEDDING_THRESHOLD, aggregate, embedding_scores, evaluate
 from .llm import JSONConstrainedMixin, LLMBackend
 from .prompts import graph_prompt, odp_prompt, scenario_prompt
 from .schemas import ConceptRelationGraph, ODPArtifact, PaperRecord, ScenarioAndCQs
 
+if TYPE_CHECKING:
+    from .embeddings import EmbeddingIndex
+
 
 class Text2ODPPipeline(JSONConstrainedMixin):
     def __init__(
@@ -34,8 +39,14 @@ class Text2ODPPipeline(JSONConstrainedMixin):
         llm: LLMBackend,
         output_dir: str = "outputs",
         collector: SemanticScholarCollector | None = None,
+        workers: int = 1,
+        embedding_index: EmbeddingIndex | None = None,
+        embedding_threshold: float = EMBEDDING_THRESHOLD,
     ) -> None:
         self.llm = llm
+        self.workers = max(1, workers)
+        self.embedding_index = embedding_index
+        self.embedding_threshold = embedding_threshold
         self.collector = collector or SemanticScholarCollector()
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -67,13 +78,27 @@ class Text2ODPPipeline(JSONConstrainedMixin):
 
     def run(self, query: str, limit: int = 20) -> dict[str, float]:
         papers = self.collect_dataset(query=query, limit=limit)
-        evaluations = []
+
+        if self.workers > 1:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                generated = list(pool.map(self.generate_for_paper, papers))
+        else:
+            generated = [self.generate_for_paper(paper) for paper in papers]
+
+        scores: Sequence[tuple[float, float] | None] = [None] * len(papers)
+        if self.embedding_index is not None:
+            scores = embedding_scores(
+                [(paper, scenario, graph) for paper, (scenario, graph, _) in zip(papers, generated)],
+                self.embedding_index,
+                self.embedding_threshold,
+            )
+        evaluations = [
+            evaluate(paper, *outputs, embedding=score)
+            for paper, outputs, score in zip(papers, generated, scores)
+        ]
 
         records = []
-        for paper in papers:
-            scenario, graph, odp = self.generate_for_paper(paper)
-            eval_result = evaluate(paper, scenario, graph, odp)
-            evaluations.append(eval_result)
+        for paper, (scenario, graph, odp), eval_result in zip(papers, generated, evaluations):
             records.append(
                 {
                     "paper": paper.model_dump(),
@@ -88,22 +113,28 @@ class Text2ODPPipeline(JSONConstrainedMixin):
             json.dump(records, fp, indent=2)
 
         summary = aggregate(evaluations)
+        if self.embedding_index is not None and summary:
+            summary["embedding_threshold"] = self.embedding_threshold
+        fieldnames = [
+            "paper_id",
+            "lexical_coverage",
+            "graph_density",
+            "cq_answerability_proxy",
+            "self_consistency",
+            "notes",
+        ]
+        if self.embedding_index is not None:
+            fieldnames += ["embedding_coverage", "embedding_cq_answerability"]
         with (self.output_dir / "evaluation.csv").open("w", encoding="utf-8", newline="") as fp:
-            writer = csv.DictWriter(
-                fp,
-                fieldnames=[
-                    "paper_id",
-                    "lexical_coverage",
-                    "graph_density",
-                    "cq_answerability_proxy",
-                    "self_consistency",
-                    "notes",
-                ],
-            )
+            writer = csv.DictWriter(fp, fieldnames=fieldnames, extrasaction="ignore")
             writer.writeheader()
             writer.writerows(r.model_dump() for r in evaluations)
 
         with (self.output_dir / "evaluation_summary.json").open("w", encoding="utf-8") as fp:
             json.dump(summary, fp, indent=2)
 
+        if hasattr(self.llm, "stats"):
+            with (self.output_dir / "backend_stats.json").open("w", encoding="utf-8") as fp:
+                json.dump(self.llm.stats(), fp, indent=2)
+
         return summary
@@ -58,3 +58,5 @@ class EvaluationResult(Serializable):
     cq_answerability_proxy: float
     self_consistency: float
     notes: str | None = None
+    embedding_coverage: float | None = None
+    embedding_cq_answerability: float | None = None
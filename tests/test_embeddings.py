@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import zlib
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from text2odp.embeddings import EmbeddingIndex  # noqa: E402
+from text2odp.evaluation import embedding_coverage, embedding_cq_answerability  # noqa: E402
+
+
+class StubEncoder:
+    """Bag-of-words hashing encoder standing in for a sentence-transformers model."""
+
+    def __init__(self, dim: int = 256) -> None:
+        self.dim = dim
+        self.encoded: list[str] = []
+
+    def encode(self, texts: list[str], normalize_embeddings: bool = True, **_kwargs):
+        self.encoded.extend(texts)
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for i, text in enumerate(texts):
+            for token in text.lower().replace("?", " ").replace(".", " ").split():
+                out[i, zlib.crc32(token.encode()) % self.dim] += 1.0
+        norms = np.linalg.norm(out, axis=1, keepdims=True)
+        return out / np.where(norms == 0, 1.0, norms)
+
+
+def _index(tmp_path, encoder: StubEncoder) -> EmbeddingIndex:
+    return EmbeddingIndex(cache_dir=tmp_path, model="stub", encoder=encoder)
+
+
+def test_embedding_index_caches_across_instances(tmp_path) -> None:
+    encoder = StubEncoder()
+    first = _index(tmp_path, encoder).embed(["patient", "treatment", "patient"])
+    assert encoder.encoded == ["patient", "treatment"]
+    assert np.allclose(first[0], first[2])
+
+    encoder = StubEncoder()
+    reopened = _index(tmp_path, encoder)
+    assert len(reopened) == 2
+    second = reopened.embed(["treatment", "patient"])
+    assert encoder.encoded == []
+    assert np.allclose(second, first[[1, 0]])
+
+
+@pytest.mark.parametrize("leftover", ["orphan_row", "torn_row"])
+def test_embedding_index_recovers_from_interrupted_append(tmp_path, leftover) -> None:
+    encoder = StubEncoder()
+    _index(tmp_path, encoder).embed(["alpha"])
+    vectors_path = tmp_path / "stub" / "vectors.f32"
+    with vectors_path.open("ab") as fp:
+        if leftover == "orphan_row":
+            # Crash after the vector for "beta" was written but before its key.
+            fp.write(encoder.encode(["beta"]).astype(np.float32).tobytes())
+        else:
+            fp.write(b"\x00" * 10)
+
+    reopened = _index(tmp_path, StubEncoder())
+    assert len(reopened) == 1
+    assert vectors_path.stat().st_size == 4 * encoder.dim
+    gamma, alpha = reopened.embed(["gamma", "alpha"])
+    assert np.allclose(gamma, encoder.encode(["gamma"])[0])
+    assert np.allclose(alpha, encoder.encode(["alpha"])[0])
+
+
+def test_embedding_index_shared_between_instances(tmp_path) -> None:
+    encoder = StubEncoder()
+    first = _index(tmp_path, encoder)
+    second = _index(tmp_path, encoder)
+
+    first.embed(["alpha"])
+    second.embed(["beta"])
+    # ``first`` has not seen "beta" yet; its append must not duplicate or shift rows.
+    beta, alpha = first.embed(["beta", "alpha"])
+
+    assert len(_index(tmp_path, encoder)) == 2
+    assert np.allclose(beta, encoder.encode(["beta"])[0])
+    assert np.allclose(alpha, encoder.encode(["alpha"])[0])
+
+
+def test_embedding_metrics(tmp_path) -> None:
+    index = _index(tmp_path, StubEncoder())
+    coverage = embedding_coverage(
+        "Patients receive treatment. Outcomes are recorded.", ["treatment", "spacecraft"], index
+    )
+    assert coverage == 0.5
+
+    answerability = embedding_cq_answerability(
+        ["Which patient receives treatment?"], ["Patient", "Treatment"], ["receives"], index
+    )
+    assert answerability == 1.0
+
+
+def test_embedding_index_rejects_dimension_mismatch(tmp_path) -> None:
+    _index(tmp_path, StubEncoder(dim=4)).embed(["a"])
+
+    reopened = _index(tmp_path, StubEncoder(dim=8))
+    with pytest.raises(ValueError, match="8-dim"):
+        reopened.embed(["b", "a"])
+    assert (tmp_path / "stub" / "vectors.f32").stat().st_size == 4 * 4
+
+
+def test_embedding_index_rejects_other_model_cache(tmp_path) -> None:
+    EmbeddingIndex(cache_dir=tmp_path, model="a/b", encoder=StubEncoder()).embed(["a"])
+
+    with pytest.raises(ValueError, match="belongs to model 'a/b'"):
+        EmbeddingIndex(cache_dir=tmp_path, model="a__b", encoder=StubEncoder())
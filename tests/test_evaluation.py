@@ -36,3 +36,31 @@ def test_aggregate_returns_stats() -> None:
     summary = aggregate(results)
     assert "lexical_coverage_mean" in summary
     assert "self_consistency_std" in summary
+
+
+def test_aggregate_includes_embedding_metrics_only_when_present() -> None:
+    base = dict(graph_density=0.2, cq_answerability_proxy=0.8, self_consistency=0.4)
+    with_embedding = [
+        EvaluationResult(
+            paper_id="1",
+            lexical_coverage=0.5,
+            embedding_coverage=0.6,
+            embedding_cq_answerability=1.0,
+            **base,
+        ),
+        EvaluationResult(
+            paper_id="2",
+            lexical_coverage=0.7,
+            embedding_coverage=0.8,
+            embedding_cq_answerability=0.5,
+            **base,
+        ),
+    ]
+    summary = aggregate(with_embedding)
+    assert summary["embedding_coverage_mean"] == 0.7
+    assert summary["embedding_cq_answerability_mean"] == 0.75
+
+    mixed = with_embedding + [EvaluationResult(paper_id="3", lexical_coverage=0.1, **base)]
+    summary = aggregate(mixed)
+    assert "embedding_coverage_mean" not in summary
+    assert "lexical_coverage_mean" in summary
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from text2odp.llm import AdaptiveConcurrencyBackend
+
+
+class SleepLLM:
+    def __init__(self, delay: float = 0.0, fail: bool = False, barrier=None) -> None:
+        self.delay = delay
+        self.fail = fail
+        self.barrier = barrier
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def generate(self, prompt: str, temperature: float = 0.2, max_tokens: int = 1024) -> str:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        if self.barrier is not None:
+            self.barrier.wait()
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        if self.fail:
+            raise RuntimeError("backend down")
+        return prompt
+
+
+def test_adaptive_limit_grows_only_when_saturated() -> None:
+    llm = AdaptiveConcurrencyBackend(SleepLLM(), initial_limit=1, max_limit=4, target_latency=1.0)
+    for i in range(20):
+        assert llm.generate(str(i)) == str(i)
+    # Only the first call filled the limit; sequential traffic never tests 3 or 4.
+    assert llm.limit == 2
+    assert llm.stats()["requests"] == 20
+
+
+def test_adaptive_limit_shrinks_on_slow_responses() -> None:
+    llm = AdaptiveConcurrencyBackend(
+        SleepLLM(delay=0.02), initial_limit=4, max_limit=4, target_latency=0.01
+    )
+    llm.generate("x")
+    stats = llm.stats()
+    assert llm.limit == 2
+    assert stats["slow"] == 1
+    assert stats["errors"] == 0
+
+
+def test_adaptive_limit_shrinks_once_per_congestion_event() -> None:
+    inner = SleepLLM(delay=0.05, barrier=threading.Barrier(4))
+    llm = AdaptiveConcurrencyBackend(inner, initial_limit=4, max_limit=4, target_latency=0.01)
+    threads = [threading.Thread(target=llm.generate, args=("x",)) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    stats = llm.stats()
+    assert stats["slow"] == 4
+    assert llm.limit == 2
+
+
+def test_adaptive_limit_shrinks_on_errors() -> None:
+    llm = AdaptiveConcurrencyBackend(SleepLLM(fail=True), initial_limit=8, max_limit=8)
+    for _ in range(3):
+        with pytest.raises(RuntimeError):
+            llm.generate("x")
+    stats = llm.stats()
+    assert llm.limit == 1
+    assert stats["errors"] == 3
+    assert stats["in_flight"] == 0
+
+
+def test_adaptive_limit_bounds_in_flight_requests() -> None:
+    inner = SleepLLM(delay=0.02)
+    llm = AdaptiveConcurrencyBackend(inner, initial_limit=2, max_limit=2, target_latency=1.0)
+    threads = [threading.Thread(target=llm.generate, args=("x",)) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert inner.peak <= 2
+    assert llm.stats()["max_in_flight"] <= 2
+
+
+def test_adaptive_releases_slot_on_base_exception() -> None:
+    class InterruptLLM:
+        def generate(self, prompt: str, temperature: float = 0.2, max_tokens: int = 1024) -> str:
+            raise KeyboardInterrupt
+
+    llm = AdaptiveConcurrencyBackend(InterruptLLM(), initial_limit=1, max_limit=1)
+    with pytest.raises(KeyboardInterrupt):
+        llm.generate("x")
+    assert llm.stats()["in_flight"] == 0
+    assert llm.stats()["errors"] == 1
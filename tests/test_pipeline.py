@@ -1,7 +1,12 @@
 from __future__ import annotations
 
 import json
+import re
+import time
 
+import pytest
+
+from text2odp.llm import AdaptiveConcurrencyBackend
 from text2odp.pipeline import Text2ODPPipeline
 from text2odp.schemas import PaperRecord
 
@@ -79,3 +84,86 @@ def test_pipeline_run_writes_artifacts(tmp_path) -> None:
     artifacts = json.loads((tmp_path / "artifacts.json").read_text(encoding="utf-8"))
     assert artifacts[0]["paper"]["paper_id"] == "p1"
     assert artifacts[0]["odp"]["pattern_name"] == "PatientTreatmentOutcomePattern"
+
+
+class MultiCollector:
+    def search(self, query: str, limit: int = 20) -> list[PaperRecord]:
+        return [
+            PaperRecord(paper_id=f"p{i}", title=f"Paper {i}", abstract=f"Topic{i} studies.")
+            for i in range(limit)
+        ]
+
+
+class PromptLLM:
+    """Thread-safe stub that answers each step from the prompt alone."""
+
+    def generate(self, prompt: str, temperature: float = 0.2, max_tokens: int = 1024) -> str:
+        topic = re.search(r"Topic\d+", prompt).group(0)
+        if prompt.startswith("You are an ontology engineer."):
+            time.sleep(0.01 * (5 - int(topic[5:])))
+            return json.dumps({"scenario": f"{topic} scenario.", "competency_questions": [topic]})
+        if prompt.startswith("Extract"):
+            return json.dumps({"concepts": [topic], "relations": [], "triples": []})
+        return json.dumps({"pattern_name": f"{topic}Pattern", "intent": topic, "classes": [topic]})
+
+
+def test_pipeline_workers_keep_paper_order(tmp_path) -> None:
+    llm = AdaptiveConcurrencyBackend(PromptLLM(), initial_limit=4, max_limit=4)
+    pipeline = Text2ODPPipeline(
+        llm=llm, collector=MultiCollector(), output_dir=str(tmp_path), workers=4
+    )
+
+    pipeline.run(query="topics", limit=5)
+
+    artifacts = json.loads((tmp_path / "artifacts.json").read_text(encoding="utf-8"))
+    assert [a["paper"]["paper_id"] for a in artifacts] == [f"p{i}" for i in range(5)]
+    assert [a["odp"]["pattern_name"] for a in artifacts] == [f"Topic{i}Pattern" for i in range(5)]
+    stats = json.loads((tmp_path / "backend_stats.json").read_text(encoding="utf-8"))
+    assert stats["requests"] == 15
+    assert stats["in_flight"] == 0
+
+
+class UniformEncoder:
+    def encode(self, texts: list[str], **_kwargs):
+        import numpy as np
+
+        return np.ones((len(texts), 4), dtype=np.float32) / 2.0
+
+
+def _csv_header(path) -> list[str]:
+    return path.read_text(encoding="utf-8").splitlines()[0].split(",")
+
+
+def test_pipeline_csv_omits_embedding_columns_by_default(tmp_path) -> None:
+    pipeline = Text2ODPPipeline(llm=StubLLM(), collector=StubCollector(), output_dir=str(tmp_path))
+
+    summary = pipeline.run(query="patient treatment", limit=1)
+
+    assert "embedding_coverage" not in _csv_header(tmp_path / "evaluation.csv")
+    assert "embedding_threshold" not in summary
+    artifacts = json.loads((tmp_path / "artifacts.json").read_text(encoding="utf-8"))
+    assert "consider adding embedding-based metrics" in artifacts[0]["evaluation"]["notes"]
+
+
+def test_pipeline_writes_embedding_metrics(tmp_path) -> None:
+    pytest.importorskip("numpy")
+    from text2odp.embeddings import EmbeddingIndex
+
+    index = EmbeddingIndex(cache_dir=tmp_path / "cache", model="uniform", encoder=UniformEncoder())
+    pipeline = Text2ODPPipeline(
+        llm=StubLLM(),
+        collector=StubCollector(),
+        output_dir=str(tmp_path / "out"),
+        embedding_index=index,
+        embedding_threshold=0.9,
+    )
+
+    summary = pipeline.run(query="patient treatment", limit=1)
+
+    header = _csv_header(tmp_path / "out" / "evaluation.csv")
+    assert header[-2:] == ["embedding_coverage", "embedding_cq_answerability"]
+    assert summary["embedding_coverage_mean"] == 1.0
+    assert summary["embedding_cq_answerability_mean"] == 1.0
+    assert summary["embedding_threshold"] == 0.9
+    artifacts = json.loads((tmp_path / "out" / "artifacts.json").read_text(encoding="utf-8"))
+    assert "consider adding" not in artifacts[0]["evaluation"]["notes"]
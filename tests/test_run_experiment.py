@@ -60,3 +60,24 @@ def test_summarize_runs(tmp_path: Path) -> None:
     assert summary["lexical_coverage_mean"] == 0.6
     assert summary["graph_density_mean"] == 0.3
     assert "self_consistency_std" in summary
+
+
+def test_summarize_runs_mixes_runs_with_and_without_embedding_metrics(tmp_path: Path) -> None:
+    header = "paper_id,lexical_coverage,graph_density,cq_answerability_proxy,self_consistency,notes"
+    (tmp_path / "run_1").mkdir()
+    (tmp_path / "run_1" / "evaluation.csv").write_text(
+        header + "\np1,0.5,0.2,0.8,0.7,ok\n", encoding="utf-8"
+    )
+    (tmp_path / "run_2").mkdir()
+    (tmp_path / "run_2" / "evaluation.csv").write_text(
+        header + ",embedding_coverage,embedding_cq_answerability\n"
+        "p2,0.7,0.4,0.6,0.9,ok,0.8,0.6\n"
+        "p3,0.7,0.4,0.6,0.9,ok,,\n",
+        encoding="utf-8",
+    )
+
+    module = _load_module(Path("scripts/run_experiment.py"))
+    summary = module.summarize_runs(tmp_path)
+
+    assert summary["lexical_coverage_mean"] == 0.6
+    assert "embedding_coverage_mean" not in summary